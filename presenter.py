@@ -5,7 +5,7 @@ PDF Presenter - Synchronized dual-window PDF viewer for presentations.
 Displays odd pages (1, 3, 5...) on the audience window and even pages (2, 4, 6...)
 on the presenter window. Navigation in either window keeps both in sync.
 
-Usage: python presenter.py presentation.pdf [config_file]
+Usage: python presenter.py [--low-memory] presentation.pdf [config_file]
 
 The optional config_file contains a comma-separated list of page numbers that
 should be shown on the audience screen. All other pages become presenter notes.
@@ -34,7 +34,13 @@ For more information, visit: https://pymupdf.io/
 """
 
 import sys
+import math
+import re
+import array
 import signal
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox
 from pathlib import Path
@@ -45,6 +51,59 @@ except ImportError:
     print("Error: PyMuPDF not installed. Run: pip install pymupdf")
     sys.exit(1)
 
+try:
+    from PIL import Image, ImageTk  # Optional: faster pixmap -> Tk conversion
+except ImportError:
+    Image = ImageTk = None  # Fall back to Tk's PPM decoder
+
+
+# Maximum number of rendered pages kept in the render cache. Entries are
+# full-size RGB rasters (several MB each on a 1080p screen).
+PAGE_CACHE_SIZE = 16
+LOW_MEMORY_PAGE_CACHE_SIZE = 8
+
+# Pixels left free around a page (split between both sides of each axis)
+CANVAS_MARGIN = 20
+
+# Render scales are rounded down to a geometric ladder with this many steps
+# per doubling (about 2% apart), so nearby canvas sizes share one render
+SCALE_STEPS_PER_OCTAVE = 32
+
+# MuPDF's internal store (decoded images, fonts) grows with every rendered
+# page. Every STORE_SHRINK_INTERVAL renders, STORE_SHRINK_PERCENT of it is
+# freed; --low-memory empties it after every render instead.
+STORE_SHRINK_INTERVAL = 10
+STORE_SHRINK_PERCENT = 50
+
+# Delay after the last navigation before neighboring slides are prerendered,
+# so rapid key presses do not queue up prefetch work for every slide passed
+PREFETCH_DELAY_MS = 50
+
+# Delay after the last resize event of either window before redrawing
+RESIZE_DEBOUNCE_MS = 120
+
+# Interval at which the Tk thread checks for a finished background render
+RENDER_POLL_MS = 10
+
+# Interval at which the Tk thread checks whether Ctrl+C was pressed
+SIGINT_POLL_MS = 100
+
+
+def quantize_scale(scale):
+    """Round a render scale down to the nearest step of the scale ladder."""
+    step = math.floor(math.log2(scale) * SCALE_STEPS_PER_OCTAVE)
+    return 2 ** (step / SCALE_STEPS_PER_OCTAVE)
+
+
+def pixmap_to_ppm(pixmap):
+    """
+    Encode an RGB or grayscale pixmap as binary PPM/PGM: a fixed header
+    followed by the raw samples.
+    """
+    magic = b"P5" if pixmap.n == 1 else b"P6"
+    header = b"%s\n%d %d\n255\n" % (magic, pixmap.width, pixmap.height)
+    return b"".join((header, pixmap.samples_mv))
+
 
 def parse_config_file(config_path):
     """
@@ -62,22 +121,25 @@ def parse_config_file(config_path):
         sys.exit(1)
     
     try:
-        content = path.read_text().strip()
-        # Parse comma-separated integers
-        pages = [int(p.strip()) for p in content.split(',') if p.strip()]
+        # Walk the comma-separated fields of the raw bytes instead of
+        # splitting the whole text into a list first
+        pages = set()
+        for match in re.finditer(rb"[^,]+", path.read_bytes()):
+            field = match.group().strip()
+            if field:
+                pages.add(int(field.decode()))
         
         if not pages:
             print("Error: Config file is empty or contains no valid page numbers")
             sys.exit(1)
         
         # Validate all pages are positive
-        if any(p < 1 for p in pages):
+        if min(pages) < 1:
             print("Error: Page numbers must be positive integers (1-indexed)")
             sys.exit(1)
         
-        # Sort and remove duplicates
-        pages = sorted(set(pages))
-        return pages
+        # Sort (duplicates were already dropped by the set)
+        return sorted(pages)
         
     except ValueError as e:
         print(f"Error: Config file must contain comma-separated integers: {e}")
@@ -87,23 +149,41 @@ def parse_config_file(config_path):
 class PDFWindow:
     """A window displaying PDF pages with auto-scaling."""
 
-    def __init__(self, master, title, on_navigate):
+    def __init__(self, master, title, request_redraw):
         self.window = tk.Toplevel(master) if master else tk.Tk()
         self.window.title(title)
+        self._title = title
         self.window.geometry("800x600")
-        self.on_navigate = on_navigate
+        self.request_redraw = request_redraw
         self.is_fullscreen = False
         self.current_image = None
+        self._image_mode = None  # Pillow mode current_image was created with
+        self.last_size = (0, 0)  # Canvas size of the last redraw
+        # Canvas size as reported by the last <Configure> event, so redraws
+        # need no winfo_width()/winfo_height() round-trips into Tk
+        self.canvas_size = (0, 0)
+        # (page, canvas width, canvas height, grayscale) of the last redraw
+        self.displayed_key = None
+        # Key and Future of a page still being rendered for this window
+        self.pending_key = None
+        self.pending_render = None
 
         # Canvas for PDF rendering
         self.canvas = tk.Canvas(self.window, bg="black", highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # One image and one text item, created hidden and then only moved,
+        # reconfigured and shown/hidden on redraw
+        self._image_id = self.canvas.create_image(0, 0, anchor=tk.CENTER, state="hidden")
+        self._text_id = self.canvas.create_text(
+            0, 0, fill="white", font=("sans-serif", 24), state="hidden"
+        )
         
         # Make canvas focusable so it can receive keyboard events
         self.canvas.focus_set()
 
         # Only bind Configure event here - all key bindings are handled in PDFPresenter
-        self.window.bind("<Configure>", self.on_resize)
+        self.canvas.bind("<Configure>", self.on_resize)
 
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
@@ -117,52 +197,86 @@ class PDFWindow:
             self.window.attributes("-fullscreen", False)
 
     def on_resize(self, event):
-        """Handle window resize - trigger redraw."""
-        if hasattr(self, 'pending_resize'):
-            self.window.after_cancel(self.pending_resize)
-        self.pending_resize = self.window.after(100, lambda: self.on_navigate("refresh"))
-
-    def display_page(self, pixmap, no_page_message="No page available"):
-        """Display a rendered PDF page (as PyMuPDF Pixmap)."""
-        if pixmap is None:
-            self.canvas.delete("all")
-            self.canvas.create_text(
-                self.canvas.winfo_width() // 2,
-                self.canvas.winfo_height() // 2,
-                text=no_page_message,
-                fill="white",
-                font=("sans-serif", 24)
-            )
-            return
+        """Handle canvas resize - record the new size and trigger redraw."""
+        self.canvas_size = (event.width, event.height)
+        if self.canvas_size == self.last_size:
+            return  # Size unchanged since the last redraw
+        self.request_redraw()
 
+    def display_page(self, page_image, no_page_message="No page available", size=None):
+        """
+        Display a rendered PDF page.
+
+        page_image is a (width, height, mode, data) tuple as returned by
+        PDFPresenter.render_page: data holds the raw "RGB" or "L" (grayscale)
+        samples, or PPM/PGM bytes when Pillow is not available.
+        If size is given, the page is resized to that (width, height) first;
+        this needs Pillow and is used for quick previews.
+        """
         # Get canvas dimensions
-        canvas_w = self.canvas.winfo_width()
-        canvas_h = self.canvas.winfo_height()
+        canvas_w, canvas_h = self.canvas_size
+
+        if page_image is None:
+            self.canvas.itemconfigure(self._image_id, state="hidden")
+            self.canvas.coords(self._text_id, canvas_w // 2, canvas_h // 2)
+            self.canvas.itemconfigure(self._text_id, text=no_page_message, state="normal")
+            return
 
         if canvas_w < 10 or canvas_h < 10:
             return
 
-        # Convert pixmap to PhotoImage
-        img_data = pixmap.tobytes("ppm")
-        self.current_image = tk.PhotoImage(data=img_data)
+        # Convert page image to PhotoImage
+        width, height, mode, data = page_image
+        if ImageTk is not None:
+            # Hand the raw samples to Tk directly, no PPM encode/decode.
+            # frombuffer wraps the cached bytes without copying them.
+            image = Image.frombuffer(mode, (width, height), data, "raw", mode, 0, 1)
+            if size is not None and size != (width, height):
+                image = image.resize(size, Image.BILINEAR)
+                width, height = size
+            if (self.current_image is not None
+                    and self._image_mode == mode
+                    and self.current_image.width() == width
+                    and self.current_image.height() == height):
+                # Same size and mode as the previous page: reuse Tk's image
+                # buffer (paste() would convert to the mode it was created with)
+                self.current_image.paste(image)
+            else:
+                # Release the old image first so both are not held at once
+                self.current_image = None
+                self.current_image = ImageTk.PhotoImage(image, master=self.canvas)
+                self._image_mode = mode
+        else:
+            self.current_image = None
+            self.current_image = tk.PhotoImage(data=data, master=self.canvas)
 
         # Center on canvas
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            canvas_w // 2, canvas_h // 2,
-            image=self.current_image,
-            anchor=tk.CENTER
-        )
+        self.canvas.itemconfigure(self._text_id, state="hidden")
+        self.canvas.coords(self._image_id, canvas_w // 2, canvas_h // 2)
+        self.canvas.itemconfigure(self._image_id, image=self.current_image, state="normal")
+
+    def is_showing(self, key):
+        """Return True if key is displayed, or already being rendered, in this window."""
+        return key == self.displayed_key or key == self.pending_key
+
+    def clear(self):
+        """Show an empty (black) canvas and release the current image."""
+        self.canvas.itemconfigure(self._image_id, image="", state="hidden")
+        self.canvas.itemconfigure(self._text_id, state="hidden")
+        self.current_image = None
 
     def set_title(self, title):
         """Update window title."""
+        if title == self._title:
+            return  # Avoid a window manager round-trip for an unchanged title
+        self._title = title
         self.window.title(title)
 
 
 class PDFPresenter:
     """Main presenter application managing two synchronized PDF windows."""
 
-    def __init__(self, pdf_path, audience_pages=None):
+    def __init__(self, pdf_path, audience_pages=None, low_memory=False):
         """
         Initialize the presenter.
         
@@ -170,37 +284,86 @@ class PDFPresenter:
             pdf_path: Path to the PDF file
             audience_pages: Optional list of 1-indexed page numbers for audience slides.
                            If None, uses default behavior (odd pages for audience).
+            low_memory: If True, keep fewer rendered pages and MuPDF cache data
+                        in memory at the cost of more re-rendering.
         """
         self.pdf_path = Path(pdf_path)
-        if not self.pdf_path.exists():
-            print(f"Error: File not found: {pdf_path}")
-            sys.exit(1)
 
-        # Load PDF
+        # Load PDF: read the file once and let PyMuPDF parse it from memory
         try:
-            self.doc = fitz.open(pdf_path)
+            with open(pdf_path, "rb") as f:
+                self.doc = fitz.open(stream=f.read(), filetype="pdf")
+        except FileNotFoundError:
+            print(f"Error: File not found: {pdf_path}")
+            sys.exit(1)
         except Exception as e:
             print(f"Error opening PDF: {e}")
             sys.exit(1)
 
-        self.total_pages = len(self.doc)
+        self.total_pages = self.doc.page_count
         
         # Build slide mapping based on config or default behavior
-        self.slides = self._build_slide_mapping(audience_pages)
-        self.num_slides = len(self.slides)
+        self._build_slide_mapping(audience_pages)
+        self.num_slides = len(self._aud)
+        self.slide_starts, self.position_slide = self._build_positions()
+        self.position = 0  # Index into the linear sequence of positions
         self.current_slide = 0  # 0-indexed
         self.current_notes_index = 0  # 0-indexed index into presenter_pages for current slide
 
+        # Render cache: (page_num, scale, grayscale) -> (width, height, mode, data),
+        # see render_page
+        self._page_cache = OrderedDict()
+        self._page_cache_size = LOW_MEMORY_PAGE_CACHE_SIZE if low_memory else PAGE_CACHE_SIZE
+        self._cache_lock = threading.Lock()
+
+        # MuPDF documents are not safe for concurrent use, so every access to
+        # self.doc from the main thread or the prefetch worker holds this lock
+        self._doc_lock = threading.Lock()
+
+        # Page sizes in points, looked up once so scaling needs no page access.
+        # A background thread fills the table so startup does not wait for
+        # every page to load; render_page looks up missing entries itself.
+        self._page_dims = [None] * self.total_pages
+        # Loaded page objects, kept so rendering a page again does not parse
+        # its page dictionary again (only pages actually used get loaded)
+        self._pages = [None] * self.total_pages
+        threading.Thread(target=self._load_page_dims, daemon=True).start()
+        self._renders_since_shrink = 0
+        if low_memory:
+            self._store_shrink_interval = 1
+            self._store_shrink_percent = 100
+        else:
+            self._store_shrink_interval = STORE_SHRINK_INTERVAL
+            self._store_shrink_percent = STORE_SHRINK_PERCENT
+
+        # Background worker that renders pages off the Tk thread: pages needed
+        # right now, and prerendering of neighboring slides into the cache
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_futures = {}
+        self._shrink_future = None
+        self._pending_prefetch = None
+
         if self.total_pages < 2:
             print("Warning: PDF has less than 2 pages. Presenter notes will be empty.")
 
+        # Handle Ctrl+C (SIGINT) to exit gracefully. Tk is not signal-safe, so
+        # the handler only sets a flag and the Tk loop does the cleanup
+        # (_poll_sigint). Installed before Tk so it is not overridden.
+        self._sigint = False
+        def handle_sigint(signum, frame):
+            self._sigint = True
+        signal.signal(signal.SIGINT, handle_sigint)
+
         # Create root window (hidden)
         self.root = tk.Tk()
         self.root.withdraw()
 
+        # Pending debounced redraw after window resizes
+        self._pending_refresh = None
+
         # Create viewer windows
-        self.audience_window = PDFWindow(self.root, "Audience View", self.navigate)
-        self.presenter_window = PDFWindow(self.root, "Presenter Notes", self.navigate)
+        self.audience_window = PDFWindow(self.root, "Audience View", self._schedule_refresh)
+        self.presenter_window = PDFWindow(self.root, "Presenter Notes", self._schedule_refresh)
 
         # Position windows side by side initially
         self.audience_window.window.geometry("800x600+50+50")
@@ -213,44 +376,57 @@ class PDFPresenter:
         # Blank screen state
         self.is_blanked = False
 
+        # Render presenter notes in grayscale (toggled with G): a third of the
+        # pixel data of RGB, and notes are mostly black-and-white text
+        self.gray_notes = True
+
+        # (slide, notes index, blanked) shown in the window titles
+        self._title_state = None
+
+        # Number of [DEBUG] lines printed so far by navigate/update_display
+        self._nav_debug_count = 0
+        self._display_debug_count = 0
+
         # Bind keys globally using bind_all for USB presenter support
-        # This ensures events are captured even when widgets don't have focus
-        # Navigation keys
-        self.root.bind_all("<Right>", lambda e: self.navigate("next"))
-        self.root.bind_all("<Left>", lambda e: self.navigate("prev"))
-        self.root.bind_all("<Up>", lambda e: self.navigate("prev"))  # Up arrow for previous
-        self.root.bind_all("<Down>", lambda e: self.navigate("next"))  # Down arrow for next
-        self.root.bind_all("<space>", lambda e: self.navigate("next"))
-        self.root.bind_all("<Next>", lambda e: self.navigate("next"))  # Page Down
-        self.root.bind_all("<Prior>", lambda e: self.navigate("prev"))  # Page Up
-        self.root.bind_all("<Home>", lambda e: self.navigate("first"))
-        self.root.bind_all("<End>", lambda e: self.navigate("last"))
-        # F5/F6 are commonly used by USB presenters
-        self.root.bind_all("<F5>", lambda e: self.navigate("next"))
-        self.root.bind_all("<F6>", lambda e: self.navigate("prev"))
-        self.root.bind_all("<F11>", lambda e: self.audience_window.toggle_fullscreen())
-        self.root.bind_all("<Escape>", lambda e: self.audience_window.exit_fullscreen())
-        
-        # Letter keys
-        self.root.bind_all("<Key-b>", lambda e: self.toggle_blank())
-        self.root.bind_all("<Key-B>", lambda e: self.toggle_blank())
-        self.root.bind_all("<Key-h>", lambda e: self.show_help())
-        self.root.bind_all("<Key-H>", lambda e: self.show_help())
-        self.root.bind_all("<Key-x>", lambda e: self.confirm_quit())
-        self.root.bind_all("<Key-X>", lambda e: self.confirm_quit())
-        
-        # Slide jump: digit input and Return key
-        for digit in "0123456789":
-            self.root.bind_all(f"<Key-{digit}>", self._on_digit)
-        self.root.bind_all("<Return>", self._on_return)
-        self.root.bind_all("<KP_Enter>", self._on_return)
+        # This ensures events are captured even when widgets don't have focus.
+        # A single <Key> binding dispatches on the keysym through this table.
+        self._keymap = {
+            # Navigation keys
+            "Right": lambda e: self.navigate("next"),
+            "Left": lambda e: self.navigate("prev"),
+            "Up": lambda e: self.navigate("prev"),  # Up arrow for previous
+            "Down": lambda e: self.navigate("next"),  # Down arrow for next
+            "space": lambda e: self.navigate("next"),
+            "Next": lambda e: self.navigate("next"),  # Page Down
+            "Prior": lambda e: self.navigate("prev"),  # Page Up
+            "Home": lambda e: self.navigate("first"),
+            "End": lambda e: self.navigate("last"),
+            # F5/F6 are commonly used by USB presenters
+            "F5": lambda e: self.navigate("next"),
+            "F6": lambda e: self.navigate("prev"),
+            "F11": lambda e: self.audience_window.toggle_fullscreen(),
+            "Escape": lambda e: self.audience_window.exit_fullscreen(),
+            # Letter keys
+            "b": lambda e: self.toggle_blank(),
+            "B": lambda e: self.toggle_blank(),
+            "g": lambda e: self.toggle_gray_notes(),
+            "G": lambda e: self.toggle_gray_notes(),
+            "h": lambda e: self.show_help(),
+            "H": lambda e: self.show_help(),
+            "x": lambda e: self.confirm_quit(),
+            "X": lambda e: self.confirm_quit(),
+            # Slide jump: Return key (digits are handled in _on_key)
+            "Return": self._on_return,
+            "KP_Enter": self._on_return,
+        }
+        self.root.bind_all("<Key>", self._on_key)
         
         # Note: We only use bind_all now to avoid double-triggering from both
         # bind_all and widget-specific bindings. bind_all captures events globally
         # regardless of focus, so widget-specific bindings are not needed.
         
         # Slide jump buffer
-        self.page_input = ""
+        self.page_input = None  # Typed slide number, None until a digit is pressed
         
         # Navigation debounce to prevent double-triggering from bind_all + widget bindings
         self._navigation_in_progress = False
@@ -259,22 +435,9 @@ class PDFPresenter:
         self.audience_window.window.focus_set()
         self.presenter_window.window.focus_set()
 
-        # Handle Ctrl+C (SIGINT) to exit gracefully
-        # Use a more direct approach for immediate exit
-        def handle_sigint(signum, frame):
-            # Try to cleanup and exit immediately
-            try:
-                self.doc.close()
-            except:
-                pass
-            # Destroy windows and exit
-            try:
-                self.root.quit()
-                self.root.destroy()
-            except:
-                pass
-            sys.exit(0)
-        signal.signal(signal.SIGINT, handle_sigint)
+        # Check for Ctrl+C periodically; this also gives Python a chance to
+        # run the signal handler while Tk's main loop is waiting for events
+        self.root.after(SIGINT_POLL_MS, self._poll_sigint)
 
         # Help window reference
         self.help_window = None
@@ -284,26 +447,24 @@ class PDFPresenter:
 
         # Initial display
         self.root.after(100, self.update_display)
-    
+
     def _build_slide_mapping(self, audience_pages):
         """
-        Build a mapping from slide index to (audience_page, presenter_pages).
-        
+        Build the slide mapping as flat integer arrays.
+
+        Slide i is shown on audience page self._aud[i]; its notes are the
+        pages in range(self._note_starts[i], self._note_ends[i]).
+
         Args:
             audience_pages: List of 1-indexed page numbers for audience slides,
                            or None for default behavior.
-        
-        Returns:
-            List of tuples: [(audience_page_0idx, [presenter_pages_0idx]), ...]
         """
         if audience_pages is None:
             # Default behavior: odd pages (1,3,5...) for audience, even (2,4,6...) for presenter
-            slides = []
-            for i in range(0, self.total_pages, 2):
-                audience_page = i  # 0-indexed
-                presenter_pages = [i + 1] if i + 1 < self.total_pages else []
-                slides.append((audience_page, presenter_pages))
-            return slides
+            self._aud = array.array('i', range(0, self.total_pages, 2))
+            self._note_starts = array.array('i', [a + 1 for a in self._aud])
+            self._note_ends = array.array('i', [min(a + 2, self.total_pages) for a in self._aud])
+            return
         
         # Custom audience pages from config
         # Convert to 0-indexed and filter out pages beyond PDF length
@@ -313,16 +474,10 @@ class PDFPresenter:
             print("Error: No valid audience pages found within PDF page range")
             sys.exit(1)
         
-        slides = []
-        for i, audience_page in enumerate(audience_pages_0idx):
-            # Presenter pages are all pages between this audience page and the next
-            if i + 1 < len(audience_pages_0idx):
-                next_audience = audience_pages_0idx[i + 1]
-            else:
-                next_audience = self.total_pages
-            
-            presenter_pages = list(range(audience_page + 1, next_audience))
-            slides.append((audience_page, presenter_pages))
+        # Presenter pages are all pages between this audience page and the next
+        self._aud = array.array('i', audience_pages_0idx)
+        self._note_starts = array.array('i', [a + 1 for a in audience_pages_0idx])
+        self._note_ends = array.array('i', audience_pages_0idx[1:] + [self.total_pages])
         
         # Debug: Print slide mapping details (only if consecutive pages detected)
         # Check if all pages are consecutive (potential issue case)
@@ -330,48 +485,101 @@ class PDFPresenter:
             is_consecutive = all(audience_pages_0idx[i] + 1 == audience_pages_0idx[i+1] 
                                for i in range(len(audience_pages_0idx) - 1))
             if is_consecutive:
-                print(f"\n[DEBUG] Consecutive audience pages detected: {len(slides)} slides created")
+                print(f"\n[DEBUG] Consecutive audience pages detected: {len(self._aud)} slides created")
                 print(f"[DEBUG] First 3 slides: ", end="")
-                for idx in range(min(3, len(slides))):
-                    aud_page, pres_pages = slides[idx]
-                    print(f"Slide {idx+1}->page {aud_page+1} ", end="")
+                for idx in range(min(3, len(self._aud))):
+                    print(f"Slide {idx+1}->page {self._aud[idx]+1} ", end="")
                 print()
-        
-        return slides
+
+    def audience_page(self, slide):
+        """Return the 0-indexed audience page of a slide."""
+        return self._aud[slide]
+
+    def presenter_pages(self, slide):
+        """Return the 0-indexed notes pages of a slide as a range (may be empty)."""
+        return range(self._note_starts[slide], self._note_ends[slide])
+
+    def _build_positions(self):
+        """
+        Build the linear sequence of positions next/prev step through: one
+        per notes page of each slide, or one for a slide without notes.
+
+        Returns:
+            (slide_starts, position_slide): arrays of the first position of
+            each slide, and of the 0-indexed slide of each position
+        """
+        slide_starts = array.array('i')
+        position_slide = array.array('i')
+        for slide_idx in range(self.num_slides):
+            slide_starts.append(len(position_slide))
+            count = max(len(self.presenter_pages(slide_idx)), 1)
+            position_slide.extend([slide_idx] * count)
+        return slide_starts, position_slide
+
+    def _set_position(self, position):
+        """Move to a position, updating the current slide and notes index."""
+        self.position = position
+        self.current_slide = self.position_slide[position]
+        self.current_notes_index = position - self.slide_starts[self.current_slide]
+
+    def _on_key(self, event):
+        """Dispatch a key press via the key table, falling back to digit input."""
+        handler = self._keymap.get(event.keysym)
+        if handler is not None:
+            handler(event)
+        else:
+            self._on_digit(event)
 
     def _on_digit(self, event):
         """Handle digit key input for slide number entry."""
-        if event.char and event.char.isdigit():
-            self.page_input += event.char
+        c = event.char
+        if c and "0" <= c <= "9":
+            # Accumulate the number directly instead of parsing a string on Enter
+            self.page_input = (self.page_input or 0) * 10 + (ord(c) - 48)
 
     def _on_return(self, event):
         """Handle Return/Enter key to jump to entered slide number."""
-        if self.page_input:
-            try:
-                slide_num = int(self.page_input)
-                self.navigate("goto", slide_num)
-            except (ValueError, TypeError):
-                pass  # Invalid input, ignore
-            finally:
-                self.page_input = ""
+        if self.page_input is not None:
+            slide_num = self.page_input
+            self.page_input = None
+            self.navigate("goto", slide_num)
 
     def toggle_blank(self):
         """Toggle blank screen for audience window."""
         self.is_blanked = not self.is_blanked
+        if self.is_blanked:
+            # Blanking only hides the audience page, no full display update needed
+            self._show_page(self.audience_window, (None,) + self.audience_window.last_size + (False,))
+            self._update_titles()
+        else:
+            self.update_display()
+
+    def toggle_gray_notes(self):
+        """Toggle grayscale rendering of the presenter notes."""
+        self.gray_notes = not self.gray_notes
         self.update_display()
 
     def show_help(self):
         """Show help window with key bindings."""
-        # If help window already exists, bring it to front
+        # If help window already exists (possibly hidden), show it and bring
+        # it to front instead of building it again
         if self.help_window is not None and self.help_window.winfo_exists():
+            self.help_window.deiconify()
             self.help_window.lift()
             self.help_window.focus_set()
             return
 
+        def close_help(event=None):
+            # Only hide the window, so showing it again is cheap
+            self.help_window.withdraw()
+            # Stop here so the global key handler does not act on the same key
+            # (e.g. H would reopen the help window right away)
+            return "break"
+
         # Create help window
         self.help_window = tk.Toplevel(self.root)
         self.help_window.title("Keyboard Shortcuts")
-        self.help_window.geometry("400x350")
+        self.help_window.geometry("400x370")
         self.help_window.resizable(False, False)
 
         # Make it stay on top
@@ -390,6 +598,7 @@ class PDFPresenter:
   DISPLAY
   ──────────────────────────────
   B               Blank audience screen
+  G               Color/grayscale notes
   F11             Toggle fullscreen
   Escape          Exit fullscreen
 
@@ -421,7 +630,7 @@ class PDFPresenter:
         close_btn = tk.Button(
             frame,
             text="Close (Esc)",
-            command=self.help_window.destroy,
+            command=close_help,
             bg="#404040",
             fg="#e0e0e0",
             activebackground="#505050",
@@ -433,9 +642,9 @@ class PDFPresenter:
         close_btn.pack(pady=(10, 0))
 
         # Bind Escape to close
-        self.help_window.bind("<Escape>", lambda e: self.help_window.destroy())
-        self.help_window.bind("<h>", lambda e: self.help_window.destroy())
-        self.help_window.bind("<H>", lambda e: self.help_window.destroy())
+        self.help_window.bind("<Escape>", close_help)
+        self.help_window.bind("<h>", close_help)
+        self.help_window.bind("<H>", close_help)
 
     def navigate(self, action, value=None):
         """Handle navigation commands."""
@@ -445,60 +654,45 @@ class PDFPresenter:
         self._navigation_in_progress = True
         
         try:
+            old_slide = self.current_slide
+            old_position = self.position
+            was_blanked = self.is_blanked
+
             # Any navigation unblocks the screen
             if action != "refresh":
                 self.is_blanked = False
 
-            old_slide = self.current_slide
-            old_notes_index = self.current_notes_index
-
+            # Positions run through every slide and its notes pages in order,
+            # so moving is index arithmetic
             if action == "next":
-                # Get current slide's presenter pages
-                _, presenter_pages = self.slides[self.current_slide]
-                # If there are notes and we haven't reached the last one, advance notes index
-                if presenter_pages and self.current_notes_index < len(presenter_pages) - 1:
-                    self.current_notes_index += 1
-                # Otherwise, advance to next slide
-                elif self.current_slide < self.num_slides - 1:
-                    self.current_slide += 1
-                    self.current_notes_index = 0
+                self._set_position(min(self.position + 1, len(self.position_slide) - 1))
             elif action == "prev":
-                # If we're not at the first notes page, go back in notes
-                if self.current_notes_index > 0:
-                    self.current_notes_index -= 1
-                # Otherwise, go to previous slide
-                elif self.current_slide > 0:
-                    self.current_slide -= 1
-                    # Set notes index to last notes page of previous slide (or 0 if no notes)
-                    _, presenter_pages = self.slides[self.current_slide]
-                    self.current_notes_index = len(presenter_pages) - 1 if presenter_pages else 0
+                self._set_position(max(self.position - 1, 0))
             elif action == "first":
-                self.current_slide = 0
-                self.current_notes_index = 0
+                self._set_position(0)
             elif action == "last":
-                self.current_slide = self.num_slides - 1
-                # Set notes index to last notes page of last slide (or 0 if no notes)
-                _, presenter_pages = self.slides[self.current_slide]
-                self.current_notes_index = len(presenter_pages) - 1 if presenter_pages else 0
+                self._set_position(len(self.position_slide) - 1)
             elif action == "goto" and value is not None:
                 # User inputs 1-indexed slide number
                 target = value - 1
                 if 0 <= target < self.num_slides:
-                    self.current_slide = target
-                    self.current_notes_index = 0
+                    self._set_position(self.slide_starts[target])
             elif action == "refresh":
                 pass  # Just redraw
 
             # Debug logging for navigation (only log when slide changes, and only for first few navigations)
-            if (old_slide != self.current_slide or old_notes_index != self.current_notes_index) and not hasattr(self, '_nav_debug_count'):
-                self._nav_debug_count = 0
-            if (old_slide != self.current_slide or old_notes_index != self.current_notes_index) and hasattr(self, '_nav_debug_count'):
+            if self.position != old_position:
                 if self._nav_debug_count < 5:  # Only log first 5 navigation events
-                    audience_page, presenter_pages = self.slides[self.current_slide]
+                    audience_page = self.audience_page(self.current_slide)
                     print(f"[DEBUG] Navigate {action}: slide {old_slide}->{self.current_slide}, "
                           f"showing audience page {audience_page+1}")
                     self._nav_debug_count += 1
 
+            # Nothing to redraw if the position did not change, e.g. "next" on
+            # the last slide or "first" on the first one
+            if action != "refresh" and not was_blanked and self.position == old_position:
+                return
+
             self.update_display()
         finally:
             # Reset navigation flag after a short delay to allow for rapid navigation
@@ -507,73 +701,322 @@ class PDFPresenter:
             else:
                 self._navigation_in_progress = False
 
-    def render_page(self, page_num, canvas_width, canvas_height):
-        """Render a PDF page scaled to fit the canvas."""
+    def _schedule_refresh(self):
+        """Schedule a redraw for when resizing has paused."""
+        # Shared by both windows, so a burst of resize events on either one
+        # ends in a single redraw
+        if self._pending_refresh is not None:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(RESIZE_DEBOUNCE_MS, self._refresh)
+
+    def _refresh(self):
+        """Run a debounced redraw."""
+        self._pending_refresh = None
+        self.navigate("refresh")
+
+    def cached_page(self, page_num, canvas_width, canvas_height, grayscale=False):
+        """
+        Return the page as render_page would, if it is in the cache, else None.
+
+        Never waits for _doc_lock (called on the Tk thread): if the page size
+        is not known yet, the page cannot be cached either.
+        """
+        if page_num < 0 or page_num >= self.total_pages:
+            return None
+        if self._page_dims[page_num] is None:
+            return None
+        scale = self._fit_scale(page_num, canvas_width, canvas_height)
+        return self._cache_get((page_num, scale, grayscale))
+
+    def _cache_get(self, key):
+        """Look up a rendered page in the LRU cache."""
+        with self._cache_lock:
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                self._page_cache.move_to_end(key)
+            return cached
+
+    def _cached_preview(self, page_num, grayscale=False):
+        """Return the largest cached render of a page at any scale, or None."""
+        best_scale, best = 0, None
+        with self._cache_lock:
+            for (cached_page, scale, cached_gray), page_image in self._page_cache.items():
+                if cached_page == page_num and cached_gray == grayscale and scale > best_scale:
+                    best_scale, best = scale, page_image
+        return best
+
+    def _fit_scale(self, page_num, canvas_width, canvas_height):
+        """Return the render scale that fits a page onto the canvas."""
+        page_width, page_height = self._page_size(page_num)
+
+        # Calculate scale to fit canvas (minus a small margin) while
+        # maintaining aspect ratio
+        scale_x = max(canvas_width - CANVAS_MARGIN, 1) / page_width
+        scale_y = max(canvas_height - CANVAS_MARGIN, 1) / page_height
+        scale = min(scale_x, scale_y)
+
+        # Round down to the scale ladder so resize jitter hits the cache
+        return quantize_scale(scale)
+
+    def render_page(self, page_num, canvas_width, canvas_height, grayscale=False):
+        """
+        Render a PDF page scaled to fit the canvas.
+
+        With grayscale=True the page is rendered with one byte per pixel
+        instead of three, which is enough for most notes pages.
+
+        Returns a (width, height, mode, data) tuple, or None if the page does
+        not exist. mode is the Pillow mode of the samples ("RGB" or "L"). data
+        holds the raw samples, or the page encoded as PPM/PGM when Pillow is
+        missing. Only plain bytes are kept, so MuPDF's pixmap buffer is freed
+        as soon as the page is rendered.
+        Results are kept in an LRU cache keyed by page, render scale and
+        colorspace, so revisiting a slide does not rasterize it again.
+        """
         if page_num < 0 or page_num >= self.total_pages:
             return None
 
-        page = self.doc[page_num]
-        page_rect = page.rect
-
-        # Calculate scale to fit canvas while maintaining aspect ratio
-        scale_x = canvas_width / page_rect.width
-        scale_y = canvas_height / page_rect.height
-        scale = min(scale_x, scale_y) * 0.95  # 95% to add small margin
+        scale = self._fit_scale(page_num, canvas_width, canvas_height)
+        key = (page_num, scale, grayscale)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
 
         # Create transformation matrix
         mat = fitz.Matrix(scale, scale)
 
-        # Render page
-        pixmap = page.get_pixmap(matrix=mat, alpha=False)
-        return pixmap
+        with self._doc_lock:
+            # Render page
+            page = self._load_page(page_num)
+            colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+            pixmap = page.get_pixmap(matrix=mat, colorspace=colorspace, alpha=False)
+
+            self._renders_since_shrink += 1
+            if self._renders_since_shrink >= self._store_shrink_interval:
+                fitz.TOOLS.store_shrink(self._store_shrink_percent)
+                self._renders_since_shrink = 0
+        data = pixmap.samples if ImageTk is not None else pixmap_to_ppm(pixmap)
+        rendered = (pixmap.width, pixmap.height, "L" if grayscale else "RGB", data)
+        pixmap = None  # Release the MuPDF buffer now rather than at the next GC
+
+        with self._cache_lock:
+            self._page_cache[key] = rendered
+            if len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+        return rendered
+
+    def _page_size(self, page_num):
+        """Return (width, height) of a page in points."""
+        dims = self._page_dims[page_num]
+        if dims is None:
+            with self._doc_lock:
+                rect = self._load_page(page_num).rect
+            dims = self._page_dims[page_num] = (rect.width, rect.height)
+        return dims
+
+    def _load_page(self, page_num):
+        """Return the page object for a page, loading it on first use (hold _doc_lock)."""
+        page = self._pages[page_num]
+        if page is None:
+            page = self._pages[page_num] = self.doc.load_page(page_num)
+        return page
+
+    def _load_page_dims(self):
+        """Fill the page size table, one page at a time (runs in a background thread)."""
+        for page_num in range(self.total_pages):
+            with self._doc_lock:
+                if self.doc.is_closed:
+                    return
+                if self._page_dims[page_num] is None:
+                    rect = self.doc[page_num].rect
+                    self._page_dims[page_num] = (rect.width, rect.height)
+
+    def _prefetch_neighbors(self):
+        """Prerender the pages shown by the next/previous navigation step in the background."""
+        self._pending_prefetch = None
+        aw, ah = self.audience_window.last_size
+        pw, ph = self.presenter_window.last_size
+
+        gray = self.gray_notes
+        jobs = []
+        presenter_pages = self.presenter_pages(self.current_slide)
+        # Neighboring notes pages of the current slide
+        for notes_index in (self.current_notes_index + 1, self.current_notes_index - 1):
+            if 0 <= notes_index < len(presenter_pages):
+                jobs.append((presenter_pages[notes_index], pw, ph, gray))
+        # Neighboring slides: entering the next slide shows its first notes page,
+        # going back to the previous slide shows its last one
+        for slide in (self.current_slide + 1, self.current_slide - 1):
+            if 0 <= slide < self.num_slides:
+                audience_page = self.audience_page(slide)
+                presenter_pages = self.presenter_pages(slide)
+                jobs.append((audience_page, aw, ah, False))
+                if presenter_pages:
+                    notes_page = presenter_pages[0] if slide > self.current_slide else presenter_pages[-1]
+                    jobs.append((notes_page, pw, ph, gray))
+        jobs = [job for job in jobs if job[1] > 10 and job[2] > 10]
+
+        # Drop queued work for slides the user has already navigated away from
+        for job, future in list(self._prefetch_futures.items()):
+            if job not in jobs or future.done():
+                future.cancel()
+                del self._prefetch_futures[job]
+
+        submitted = False
+        for job in jobs:
+            if job not in self._prefetch_futures:
+                self._prefetch_futures[job] = self._prefetch_pool.submit(self.render_page, *job)
+                submitted = True
+        # Runs on the same worker after the batch has been rendered; queue it
+        # again if the last one was cancelled before it got to run
+        shrink_cancelled = self._shrink_future is not None and self._shrink_future.cancelled()
+        if submitted or shrink_cancelled:
+            self._shrink_future = self._prefetch_pool.submit(self._shrink_store)
+
+    def _shrink_store(self):
+        """Trim MuPDF's store, e.g. after a batch of prefetch renders."""
+        with self._doc_lock:
+            if not self.doc.is_closed:
+                fitz.TOOLS.store_shrink(self._store_shrink_percent)
+                self._renders_since_shrink = 0
+
+    def _cancel_prefetch(self):
+        """Drop prefetch jobs that have not started yet."""
+        for future in self._prefetch_futures.values():
+            future.cancel()
+        self._prefetch_futures.clear()
+        if self._shrink_future is not None:
+            self._shrink_future.cancel()
+
+    def _close_document(self):
+        """Stop background rendering, drop cached pages and close the PDF."""
+        # Drop queued renders by hand: shutdown(cancel_futures=True) needs 3.9
+        self._cancel_prefetch()
+        for window in (self.audience_window, self.presenter_window):
+            if window.pending_render is not None:
+                window.pending_render.cancel()
+        self._prefetch_pool.shutdown(wait=False)
+        with self._cache_lock:
+            self._page_cache.clear()
+        # Wait (briefly) for a render in progress before freeing the document
+        if self._doc_lock.acquire(timeout=1.0):
+            try:
+                self.doc.close()
+                fitz.TOOLS.store_shrink(100)  # Free MuPDF's cached fonts and images
+            except:
+                pass  # Ignore errors during cleanup
+            finally:
+                self._doc_lock.release()
 
     def update_display(self):
         """Update both windows with current slide."""
         # Get page mapping for current slide
-        audience_page, presenter_pages = self.slides[self.current_slide]
-
-        # Ensure current_notes_index is valid
-        if presenter_pages:
-            self.current_notes_index = min(self.current_notes_index, len(presenter_pages) - 1)
-        else:
-            self.current_notes_index = 0
+        audience_page = self.audience_page(self.current_slide)
+        presenter_pages = self.presenter_pages(self.current_slide)
 
         # Render and display audience page
-        aw = self.audience_window.canvas.winfo_width()
-        ah = self.audience_window.canvas.winfo_height()
+        aw, ah = self.audience_window.canvas_size
         
         # Debug: Log what's being displayed (more verbose for consecutive pages case)
-        if not hasattr(self, '_display_debug_count'):
-            self._display_debug_count = 0
         # Log more times if we have consecutive pages (potential issue case)
         max_logs = 10 if not presenter_pages else 3
         if self._display_debug_count < max_logs:
             print(f"[DEBUG] Display: slide {self.current_slide}, audience page {audience_page+1}, "
                   f"canvas size {aw}x{ah}, blanked={self.is_blanked}")
             self._display_debug_count += 1
-        if aw > 10 and ah > 10:
-            if self.is_blanked:
-                # Show black screen
-                self.audience_window.canvas.delete("all")
-                self.audience_window.current_image = None
-            else:
-                audience_pixmap = self.render_page(audience_page, aw, ah)
-                self.audience_window.display_page(audience_pixmap)
+        # Each window is only redrawn if what it shows (page or blank screen,
+        # canvas size, colorspace) differs from its last redraw
+        audience_key = (None if self.is_blanked else audience_page, aw, ah, False)
+        if aw > 10 and ah > 10 and not self.audience_window.is_showing(audience_key):
+            # Page None shows a black screen when blanked
+            self._show_page(self.audience_window, audience_key)
 
         # Render and display presenter page based on current notes index
-        pw = self.presenter_window.canvas.winfo_width()
-        ph = self.presenter_window.canvas.winfo_height()
-        if pw > 10 and ph > 10:
-            if presenter_pages:
-                # Show the notes page at current index
-                presenter_page = presenter_pages[self.current_notes_index]
-                presenter_pixmap = self.render_page(presenter_page, pw, ph)
-                self.presenter_window.display_page(presenter_pixmap)
+        pw, ph = self.presenter_window.canvas_size
+        presenter_page = presenter_pages[self.current_notes_index] if presenter_pages else None
+        presenter_key = (presenter_page, pw, ph, self.gray_notes)
+        if pw > 10 and ph > 10 and not self.presenter_window.is_showing(presenter_key):
+            # Without notes, show black screen with message
+            self._show_page(self.presenter_window, presenter_key, "No related notes available")
+
+        self._update_titles()
+
+        # Prerender whatever the next keypress will most likely show
+        if self._pending_prefetch is not None:
+            self.root.after_cancel(self._pending_prefetch)
+        self._pending_prefetch = self.root.after(PREFETCH_DELAY_MS, self._prefetch_neighbors)
+
+    def _show_page(self, window, key, no_page_message=None):
+        """
+        Show a page in a window.
+
+        key is (page_num, canvas width, canvas height, grayscale). A page_num
+        of None shows no_page_message, or a black screen if there is no message.
+        Pages missing from the cache are rendered on the worker thread so
+        the Tk event loop stays responsive, and displayed once ready unless
+        the window has been given something else to show meanwhile.
+        """
+        page_num, width, height, grayscale = key
+        window.last_size = (width, height)
+        # Anything still rendering for this window is stale now; if it has
+        # not started yet (e.g. B pressed right after navigating), skip it
+        if window.pending_render is not None:
+            window.pending_render.cancel()
+            window.pending_key = window.pending_render = None
+
+        page_image = None if page_num is None else self.cached_page(*key)
+        if page_num is None or page_image is not None:
+            if page_image is not None:
+                window.display_page(page_image)
+            elif no_page_message is not None:
+                window.display_page(None, no_page_message)
             else:
-                # No notes available - show black screen with message
-                self.presenter_window.display_page(None, "No related notes available")
+                window.clear()
+            window.displayed_key = key
+            return
 
-        # Update window titles
+        # The page is needed now: don't let queued prefetch work go first
+        self._cancel_prefetch()
+        future = self._prefetch_pool.submit(self.render_page, *key)
+        window.pending_key = key
+        window.pending_render = future
+        # The window no longer shows what it should; without this, going
+        # back to its last page before the render lands would skip the redraw
+        window.displayed_key = None
+        self.root.after(RENDER_POLL_MS, self._finish_render, window, key, future)
+
+        # While the worker renders, stretch a render of the same page at
+        # another size (e.g. from before a resize) to fit, so the window
+        # does not keep showing a stale page or size meanwhile
+        if ImageTk is not None:
+            preview = self._cached_preview(page_num, grayscale)
+            # A cached render means render_page has already stored the page
+            # size, so _page_size does not need _doc_lock here
+            if preview is not None:
+                scale = self._fit_scale(page_num, width, height)
+                page_width, page_height = self._page_size(page_num)
+                size = (max(round(page_width * scale), 1), max(round(page_height * scale), 1))
+                window.display_page(preview, size=size)
+
+    def _finish_render(self, window, key, future):
+        """Display a background render once it is done, unless it is stale."""
+        if window.pending_render is not future:
+            return  # Superseded by a later navigation
+        if not future.done():
+            self.root.after(RENDER_POLL_MS, self._finish_render, window, key, future)
+            return
+        window.pending_key = window.pending_render = None
+        window.display_page(future.result())
+        window.displayed_key = key
+
+    def _update_titles(self):
+        """Show the current slide, notes and blank state in the window titles."""
+        title_state = (self.current_slide, self.current_notes_index, self.is_blanked)
+        if title_state == self._title_state:
+            return
+        self._title_state = title_state
+
+        presenter_pages = self.presenter_pages(self.current_slide)
         slide_info = f"Slide {self.current_slide + 1}/{self.num_slides}"
         notes_info = ""
         if presenter_pages:
@@ -671,7 +1114,7 @@ class PDFPresenter:
 
             # Bind keyboard shortcuts to dialog window
             self.quit_dialog.bind("<Return>", lambda e: self.quit())
-            self.quit_dialog.bind("<Escape>", lambda e: self._cancel_quit())
+            self.quit_dialog.bind("<Escape>", self._cancel_quit)
             self.quit_dialog.bind("<Key-x>", lambda e: self.quit())  # Also allow x to quit from dialog
             self.quit_dialog.bind("<Key-X>", lambda e: self.quit())
             
@@ -688,7 +1131,7 @@ class PDFPresenter:
             print(f"Error creating quit dialog: {e}")
             self.quit()
 
-    def _cancel_quit(self):
+    def _cancel_quit(self, event=None):
         """Cancel quit and close dialog."""
         if self.quit_dialog is not None:
             try:
@@ -710,6 +1153,15 @@ class PDFPresenter:
                     self.presenter_window.window.focus_set()
                 except:
                     pass
+        # When bound to Escape, keep the global key handler from also
+        # leaving fullscreen on the same key press
+        return "break"
+
+    def _poll_sigint(self):
+        """Quit on the Tk thread once Ctrl+C has been pressed."""
+        if self._sigint:
+            self.quit()
+        self.root.after(SIGINT_POLL_MS, self._poll_sigint)
 
     def quit(self):
         """Clean up and exit."""
@@ -725,10 +1177,7 @@ class PDFPresenter:
                 pass
             self.quit_dialog = None
         
-        try:
-            self.doc.close()
-        except:
-            pass  # Ignore errors during cleanup
+        self._close_document()
         self.root.quit()
         self.root.destroy()
         sys.exit(0)
@@ -740,7 +1189,8 @@ class PDFPresenter:
         
         # Show slide mapping summary
         print("\nSlide mapping:")
-        for i, (aud_page, pres_pages) in enumerate(self.slides):
+        for i in range(self.num_slides):
+            aud_page, pres_pages = self.audience_page(i), self.presenter_pages(i)
             pres_str = f"notes: {[p+1 for p in pres_pages]}" if pres_pages else "no notes"
             print(f"  Slide {i+1}: page {aud_page+1} ({pres_str})")
         
@@ -750,6 +1200,7 @@ class PDFPresenter:
         print("  Home                      - First slide")
         print("  End                       - Last slide")
         print("  B                     - Blank/unblank audience screen")
+        print("  G                     - Toggle color/grayscale notes")
         print("  H                     - Show help (presenter window)")
         print("  F11                   - Toggle fullscreen")
         print("  Escape                - Exit fullscreen")
@@ -762,8 +1213,13 @@ class PDFPresenter:
 
 
 def main():
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print("Usage: python presenter.py <pdf_file> [config_file]")
+    args = sys.argv[1:]
+    low_memory = "--low-memory" in args
+    if low_memory:
+        args.remove("--low-memory")
+
+    if len(args) < 1 or len(args) > 2:
+        print("Usage: python presenter.py [--low-memory] <pdf_file> [config_file]")
         print("\nDefault behavior (no config file):")
         print("  - Odd pages (1, 3, 5...): Audience slides")
         print("  - Even pages (2, 4, 6...): Presenter notes")
@@ -774,17 +1230,19 @@ def main():
         print("  - Page 1 is audience slide 1, pages 2-3 are its presenter notes")
         print("  - Page 4 is audience slide 2, pages 5-7 are its presenter notes")
         print("  - Page 8 is audience slide 3, remaining pages are its notes")
+        print("\nOptions:")
+        print("  --low-memory  Keep less rendered data in memory (for large, image-heavy PDFs)")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
+    pdf_path = args[0]
     
     audience_pages = None
-    if len(sys.argv) == 3:
-        config_path = sys.argv[2]
+    if len(args) == 2:
+        config_path = args[1]
         audience_pages = parse_config_file(config_path)
         print(f"Config loaded: audience pages are {audience_pages}")
     
-    presenter = PDFPresenter(pdf_path, audience_pages)
+    presenter = PDFPresenter(pdf_path, audience_pages, low_memory=low_memory)
     presenter.run()
 
 